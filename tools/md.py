@@ -1,6 +1,18 @@
 from typing import Dict
 import re
 
+# Use RE2 (linear-time matching) for the ruby pattern when it is installed.
+# It is an optional dependency; the standard re module is used otherwise.
+try:
+    import re2 as _ruby_re_engine
+except ImportError:
+    _ruby_re_engine = re
+
+_RUBY_RE = _ruby_re_engine.compile(r'\|([^<|]+)<([^>]+)>')
+_RUBY_TEMPLATE = r'<ruby>\1<rt>\2</rt></ruby>'
+# H1 header line (allow optional leading spaces); group 1 is the stripped key
+_H1_RE = re.compile(r'^[^\S\n]*# [^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+
 def to_html_ruby(content: str) -> str:
     """
     Convert Ruby annotations in the content to HTML <ruby> tags.
@@ -28,13 +40,40 @@ def to_html_ruby(content: str) -> str:
     >>> to_html_ruby(content)
     '<ruby>複雑<rt>ふくざつ</rt></ruby>な<ruby>例<rt>れい</rt></ruby>です。'
     """
-    def replace_ruby(match: re.Match) -> str:
-        base_text = match.group(1)
-        annotation = match.group(2)
-        return f'<ruby>{base_text}<rt>{annotation}</rt></ruby>'
+    # Most titles and paragraphs have no ruby at all; skip the regex for them
+    if "|" not in content:
+        return content
+    output = _RUBY_RE.sub(_RUBY_TEMPLATE, content)
+    return output
 
-    pattern = r'\|([^<|]+)<([^>]+)>'
-    output = re.sub(pattern, replace_ruby, content)
+
+def to_plain_ruby(content: str) -> str:
+    """
+    Replace Ruby annotations in the content with their base text.
+
+    Parameters
+    ----------
+    content: str
+        The content string containing Ruby annotations in the format
+        "|{base_text}<{annotation}>".
+
+    Returns
+    -------
+    output: str
+        The content string with each Ruby annotation replaced by its base text.
+
+    Examples
+    --------
+    >>> content = "|漢字<かんじ> is a Japanese word."
+    >>> to_plain_ruby(content)
+    '漢字 is a Japanese word.'
+    >>> content = "|複雑<ふくざつ>な|例<れい>です。"
+    >>> to_plain_ruby(content)
+    '複雑な例です。'
+    """
+    if "|" not in content:
+        return content
+    output = _RUBY_RE.sub(r'\1', content)
     return output
 
 
@@ -66,42 +105,30 @@ def md_to_json(path: str) -> dict:
     JsonKeyDuplicateError
         If duplicate keys are found in the Markdown file.
     """
-    result: Dict[str, str] = {}
-    current_key = None
-    buffer: list[str] = []
-
     with open(path, "r", encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.rstrip("\n")
-
-            # Detect H1 header (allow optional leading spaces)
-            stripped = line.lstrip()
-            if stripped.startswith("# "):
-                key = stripped[2:].strip()
-
-                # If we were collecting for a previous key, flush it
-                if current_key is not None:
-                    value = "\n".join(buffer)
-                    result[current_key] = value
-                    buffer = []
-
-                # Check duplicate keys
-                if key in result:
-                    raise JsonKeyDuplicateError(f"Duplicate key found: {key}")
-
-                current_key = key
-            else:
-                # Only collect content if a top-level key has been started
-                if current_key is not None:
-                    buffer.append(line)
-
-    # Flush the last collected value if any
-    if current_key is not None:
-        value = "\n".join(buffer)
-        result[current_key] = value
+        text = f.read()
+
+    result: Dict[str, str] = {}
+    headers = list(_H1_RE.finditer(text))
+    for i, m in enumerate(headers):
+        key = m.group(1)
+
+        # Check duplicate keys
+        if key in result:
+            raise JsonKeyDuplicateError(f"Duplicate key found: {key}")
+
+        # The value spans from the line after the header to the next header
+        value_start = m.end() + 1
+        value_end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        # Drop the newline that terminates the last line before slicing so
+        # that the value is copied out of the file text only once
+        if value_end > value_start and text[value_end - 1] == "\n":
+            value_end -= 1
+        result[key] = text[value_start:value_end]
 
     return result
 
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -3,15 +3,36 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Tuple, Union, Optional
+from typing import Iterable, List, Dict, Tuple, Union, Optional
 
+import bisect
 import hashlib
+import json
+import os
+import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 import md
 from story import Story
 
-VALID_STATUS = {"連載中", "完結済", "更新停止"}
+VALID_STATUS = frozenset({"連載中", "完結済", "更新停止"})
+
+# index.md で使えるヘッダ / 必須ヘッダ
+_ALLOWED_HEADERS = frozenset(
+    {"title", "tags", "status", "outline", "external links", "chapters"}
+)
+_REQUIRED_HEADERS = frozenset({"title", "tags", "status", "outline"})
+
+# external links の一行（strip 済み）: 「- [text](url)」
+_EXTERNAL_LINK_LINE_RE = re.compile(r"- \s*\[.*\]\(.*\)")
+
+# chapters の一行（strip 済み）: 「章タイトル: 章区切り番号」
+_CHAPTER_LINE_RE = re.compile(r"([^:\s][^:]*?)\s*:\s*([+-]?\d+)")
+
+# 話ファイルを並行して読み込むスレッド数の上限
+_STORY_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 @dataclass(frozen=True)
@@ -34,8 +55,20 @@ class Novel:
     @staticmethod
     def load_if_valid(path: Union[str, Path]) -> Union["Novel", List[str]]:
         """index.md + 配下の話ファイルを検証し、妥当なら Novel を返す。"""
+        return Novel._load(path, None)
+
+    @staticmethod
+    def _load(
+        path: Union[str, Path], executor: Optional[ThreadPoolExecutor]
+    ) -> Union["Novel", List[str]]:
+        """
+        load_if_valid の本体。
+        executor が与えられればそのスレッドプールで話ファイルを読み込む。
+        """
         p = Path(path)
         errors: List[str] = []
+        # 検証ループ内で繰り返し使うので属性参照を一度だけにしておく
+        add_error = errors.append
 
         if not p.is_file():
             return [f"Novel index file not found: {p}"]
@@ -47,53 +80,52 @@ class Novel:
         except md.JsonKeyDuplicateError as e:
             return [f"Duplicate header: {e}"]
 
-        allowed = {"title", "tags", "status", "outline", "external links", "chapters"}
-        required = {"title", "tags", "status", "outline"}
-
+        # H1 が 1 つも無ければ以降の検証は全て無意味なので即座に返す
         if not data:
-            errors.append(
+            return [
                 "No H1 headers found. Required headers: title, tags, status, outline"
-            )
+            ]
 
         # 未定義ヘッダ
-        for key in data.keys():
-            if key not in allowed:
-                errors.append(f"Unexpected header: {key}")
+        for key in sorted(data.keys() - _ALLOWED_HEADERS):
+            add_error(f"Unexpected header: {key}")
 
         # 必須ヘッダ不足
-        for key in required:
-            if key not in data:
-                errors.append(f"Missing required header: {key}")
+        for key in sorted(_REQUIRED_HEADERS - data.keys()):
+            add_error(f"Missing required header: {key}")
 
-        # ブランクチェック
+        # ブランクチェック（md_to_json の値は常に str）
         for key, value in data.items():
-            if not str(value).strip():
-                errors.append(f"`{key}` must not be empty")
+            if not value.strip():
+                add_error(f"`{key}` must not be empty")
 
-        # title: 1行限定
+        # 各ヘッダの値は一度だけ取り出して strip しておく
         title_val = data.get("title", "")
+        tags_val = data.get("tags", "")
+        status_val = data.get("status", "")
+        title_stripped = title_val.strip()
+        status_stripped = status_val.strip()
+
+        # title: 1行限定
         if "title" in data and ("\n" in title_val or "\r" in title_val):
-            errors.append("`title` must be a single line")
+            add_error("`title` must be a single line")
 
         # tags: 要素数1以上の Markdown リスト
-        tags_val = data.get("tags", "")
         if "tags" in data:
             tag_lines = [
-                line.strip()
-                for line in tags_val.strip().splitlines()
-                if line.strip()
+                stripped
+                for stripped in (line.strip() for line in tags_val.splitlines())
+                if stripped
             ]
             if not tag_lines or any(not l.startswith("- ") for l in tag_lines):
-                errors.append(
+                add_error(
                     "`tags` must be a Markdown list with at least one item"
                 )
 
         # status: 定義済みリテラルのみ
-        status_val = data.get("status", "")
         if "status" in data:
-            s = status_val.strip()
-            if s not in VALID_STATUS:
-                errors.append(
+            if status_stripped not in VALID_STATUS:
+                add_error(
                     '`status` must be one of "連載中", "完結済", "更新停止"'
                 )
 
@@ -108,33 +140,22 @@ class Novel:
                 if line.strip()
             ]
             if not lines:
-                errors.append(
+                add_error(
                     "`external links` must be a Markdown list with at least one item"
                 )
             else:
                 for l in lines:
+                    if _EXTERNAL_LINK_LINE_RE.fullmatch(l):
+                        continue
                     if not l.startswith("- "):
-                        errors.append(
+                        add_error(
                             "`external links` must be a Markdown list"
                         )
-                        break
-                    item = l[2:].strip()
-                    # if not (item.startswith('"') and item.endswith('"')):
-                    #     errors.append(
-                    #         'Each `external links` item must be a quoted Markdown link: - "[text](url)"'
-                    #     )
-                    #     break
-                    # inner = item[1:-1]
-                    inner = item
-                    if not (
-                        inner.startswith("[")
-                        and "](" in inner
-                        and inner.endswith(")")
-                    ):
-                        errors.append(
+                    else:
+                        add_error(
                             'Each `external links` item must contain a Markdown link like "[text](url)" inside quotes'
                         )
-                        break
+                    break
             if not errors:
                 external_links_str = external_links_val
                 has_external_links = True
@@ -150,38 +171,40 @@ class Novel:
                 if line.strip()
             ]
             if not lines:
-                errors.append("`chapters` must not be empty if provided")
+                add_error("`chapters` must not be empty if provided")
             else:
                 tmp: Dict[str, int] = {}
                 titles_seen = set()
                 nums_seen = set()
                 for l in lines:
-                    if ":" not in l:
-                        errors.append(
-                            "`chapters` must be in '章タイトル: 章区切り番号' format"
-                        )
-                        tmp = {}
-                        break
-                    k, v = l.split(":", 1)
-                    k = k.strip()
-                    v = v.strip()
-                    if not k or not v:
-                        errors.append(
-                            "`chapters` must be valid key: value pairs"
-                        )
+                    m = _CHAPTER_LINE_RE.fullmatch(l)
+                    if m is None:
+                        # 不一致の原因を切り分けてエラーメッセージを選ぶ
+                        if ":" not in l:
+                            add_error(
+                                "`chapters` must be in '章タイトル: 章区切り番号' format"
+                            )
+                        else:
+                            k, v = l.split(":", 1)
+                            k = k.strip()
+                            if not k or not v.strip():
+                                add_error(
+                                    "`chapters` must be valid key: value pairs"
+                                )
+                            elif k in titles_seen:
+                                add_error("`chapters` titles must be unique")
+                            else:
+                                add_error("`chapters` values must be integers")
                         tmp = {}
                         break
+                    k = m.group(1)
+                    num = int(m.group(2))
                     if k in titles_seen:
-                        errors.append("`chapters` titles must be unique")
-                        tmp = {}
-                        break
-                    if not _is_int_string(v):
-                        errors.append("`chapters` values must be integers")
+                        add_error("`chapters` titles must be unique")
                         tmp = {}
                         break
-                    num = int(v)
                     if num in nums_seen:
-                        errors.append("`chapters` numbers must be unique")
+                        add_error("`chapters` numbers must be unique")
                         tmp = {}
                         break
                     titles_seen.add(k)
@@ -194,44 +217,64 @@ class Novel:
                     )
                     has_chapters = True
 
+        # index.md に不正があれば話ファイルの走査・読み込みは行わない
         if errors:
             return errors
 
         # --- 話ファイルの収集・単体検証 ---
 
         novel_dir = p.parent
-        story_files = sorted(
-            f
-            for f in novel_dir.iterdir()
-            if f.is_file()
-            and f.suffix == ".md"
-            and f.name != "index.md"
-            and not f.name.startswith("_")
-        )
+        with os.scandir(novel_dir) as it:
+            entries = [
+                e
+                for e in it
+                if e.is_file()
+                and e.name.endswith(".md")
+                and e.name != "index.md"
+                and not e.name.startswith("_")
+            ]
+        entries.sort(key=attrgetter("name"))
+        story_files = [Path(e.path) for e in entries]
+
+        # 話ファイルの読み込みは I/O 待ちが主なのでスレッドで並行させる
+        # （map は入力順で結果を返すため、エラーの順序も従来通り）
+        if executor is not None:
+            results = list(executor.map(Story.load_if_valid, story_files))
+        elif len(story_files) > 1:
+            max_workers = min(_STORY_LOAD_WORKERS, len(story_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                results = list(ex.map(Story.load_if_valid, story_files))
+        else:
+            # 1 話以下ならスレッドを起動するまでもない
+            results = [Story.load_if_valid(sf) for sf in story_files]
 
         stories: List[Story] = []
-        for sf in story_files:
-            result = Story.load_if_valid(sf)
+        for sf, result in zip(story_files, results):
             if isinstance(result, list):
                 for msg in result:
-                    errors.append(f"{sf}: {msg}")
+                    add_error(f"{sf}: {msg}")
             else:
                 stories.append(result)
 
         # --- 複数話をまたぐ検証 ---
 
         # number の重複
-        nums = [s.number for s in stories]
-        for num, cnt in Counter(nums).items():
-            if cnt > 1:
-                errors.append(f"Duplicate story number found: {num}")
+        nums = list(map(attrgetter("number"), stories))
+        if len(nums) != len(set(nums)):
+            for num, cnt in Counter(nums).items():
+                if cnt > 1:
+                    add_error(f"Duplicate story number found: {num}")
 
         # 章区切りがある場合、全話がいずれかの章に属するか判定
         if has_chapters and chapters_dict:
-            bounds = list(chapters_dict.items())  # (章タイトル, 章区切り番号), 昇順
+            # 章タイトル・章区切り番号（昇順）
+            boundary_titles = list(chapters_dict.keys())
+            boundary_values = list(chapters_dict.values())
             for s in stories:
-                if _find_chapter_for_number(s.number, bounds) is None:
-                    errors.append(
+                if _find_chapter_for_number(
+                    s.number, boundary_values, boundary_titles
+                ) is None:
+                    add_error(
                         f"Story {s.path.name} (number={s.number}) does not belong to any chapter"
                     )
 
@@ -240,14 +283,16 @@ class Novel:
 
         # --- プロパティ構築 ---
 
-        stories_sorted = tuple(sorted(stories, key=lambda s: s.number))
+        # ファイル名順で既に話数順のことが多く、その場合 sort はほぼ線形で終わる
+        stories.sort(key=attrgetter("number"))
+        stories_sorted = tuple(stories)
         total_length = sum(s.length for s in stories_sorted)
 
         return Novel(
             path=p,
-            title=title_val.strip(),
+            title=title_stripped,
             tags=tags_val,
-            status=status_val.strip(),
+            status=status_stripped,
             outline=data.get("outline", ""),
             external_links=external_links_str,
             chapters=chapters_dict,
@@ -258,6 +303,23 @@ class Novel:
             total_length=total_length,
         )
 
+    @staticmethod
+    def load_many(
+        paths: Iterable[Union[str, Path]],
+    ) -> List[Union["Novel", List[str]]]:
+        """
+        複数の index.md を load_if_valid で検証し、入力と同じ順序で結果を返す。
+        全小説の話ファイルを一つのスレッドプールで読み込む
+        （小説ごとにプールを作るとスレッド数が小説数に比例して増えるため）。
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        # index.md の検証は小説ごとに順に行い、話ファイルの読み込みだけを共有プールで並行させる。
+        # プール上のタスクは他のタスクを待たないので、デッドロックしない
+        with ThreadPoolExecutor(max_workers=_STORY_LOAD_WORKERS) as ex:
+            return [Novel._load(p, ex) for p in paths]
+
     def get_stories_ordered(
         self,
     ) -> Union[Tuple[Story, ...], Dict[str, Tuple[Story, ...]]]:
@@ -276,10 +338,14 @@ class Novel:
         }
         bounds = list(self.chapters.items())  # (章タイトル, 章区切り番号), 昇順
 
+        # self.stories も話数番号の昇順なので、両者を先頭から突き合わせる
+        j = 0
         for s in self.stories:
-            chapter = _find_chapter_for_number(s.number, bounds)
-            if chapter is not None:
-                ordered[chapter].append(s)
+            while j < len(bounds) and s.number > bounds[j][1]:
+                j += 1
+            if j == len(bounds):
+                break
+            ordered[bounds[j][0]].append(s)
 
         return {k: tuple(v) for k, v in ordered.items()}
 
@@ -288,39 +354,51 @@ class Novel:
         コンテンツのハッシュを
         title, tags, status, outline, external_links, chapters,
         stories の全 Story.hash() から計算する。
+        インスタンスは不変なので、一度計算した値をインスタンスに保持して再利用する。
         """
+        cached = self.__dict__.get("_hash")
+        if cached is not None:
+            return cached
+
         parts = [
             self.title,
             self.tags,
             self.status,
             self.outline,
             self.external_links or "",
-            repr(self.chapters) if self.chapters else "",
         ]
-        for s in self.stories:
-            parts.append(s.hash())
-
-        base = "\n".join(parts)
-        return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
+        # 各要素を改行区切りで逐次投入する（"\n".join したものと同じ値になる）
+        h = hashlib.sha256(parts[0].encode("utf-8"))
+        for part in parts[1:]:
+            h.update(b"\n")
+            h.update(part.encode("utf-8"))
+        # chapters は repr に依存せず、区切り文字を含むタイトルとも衝突しない
+        # JSON の [[章タイトル, 章区切り番号], ...] で表す
+        h.update(b"\n")
+        if self.chapters:
+            chapters_json = json.dumps(list(self.chapters.items()), ensure_ascii=False)
+            h.update(chapters_json.encode("utf-8"))
+        for s in self.stories:
+            h.update(b"\n")
+            h.update(s.hash().encode("utf-8"))
+        digest = h.hexdigest()
 
-def _is_int_string(s: str) -> bool:
-    if not s:
-        return False
-    if s[0] in "+-":
-        return s[1:].isdigit()
-    return s.isdigit()
+        # frozen dataclass なので object.__setattr__ で保持する
+        object.__setattr__(self, "_hash", digest)
+        return digest
 
 
 def _find_chapter_for_number(
-    number: int, bounds: List[tuple[str, int]]
+    number: int, boundary_values: List[int], boundary_titles: List[str]
 ) -> Optional[str]:
     """
     章区切り番号に基づいて話数が属する章タイトルを返す。
     ルール: 話数番号 <= 章区切り番号 を満たす最初の章（境界値昇順）に属する。
     条件を満たす章が無ければ None。
+    boundary_values は昇順の章区切り番号、boundary_titles は対応する章タイトル。
     """
-    for title, boundary in bounds:
-        if number <= boundary:
-            return title
+    i = bisect.bisect_left(boundary_values, number)
+    if i < len(boundary_values):
+        return boundary_titles[i]
     return None
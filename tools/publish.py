@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 import html
 from pathlib import Path
-from typing import Dict, Tuple, Optional, List
-
-from markdown import markdown as md_to_html
+from typing import Dict, Tuple, Optional, List, Set
 
 import md
 from story import Story
@@ -22,6 +25,10 @@ SITE_ORIGIN = "https://www.mogura-novel.com"  # 例: "https://novel.example.com"
 # X (Twitter) アカウント
 TWITTER_HANDLE = "@I_am_a_mole1"
 
+# 本文中の全角スペースは Markdown 変換で潰れないよう文字参照にする
+IDEOGRAPHIC_SPACE = "\u3000"
+IDEOGRAPHIC_SPACE_REF = "&#x3000;"
+
 
 # ====== 更新履歴 (CSV) ======
 History = Dict[str, Tuple[str, str]]  # path -> (hash, iso_timestamp)
@@ -43,11 +50,9 @@ def load_history(path: Path) -> History:
 
 def save_history(path: Path, history: History) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    items = sorted(history.items(), key=lambda x: x[0])
+    items = sorted(history.items())
     with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        for filename, (h, ts) in items:
-            writer.writerow([filename, h, ts])
+        csv.writer(f).writerows((filename, h, ts) for filename, (h, ts) in items)
 
 
 def update_history_entry(
@@ -65,6 +70,110 @@ def update_history_entry(
         return old[1]
 
 
+# ====== ビルドキャッシュ (CSV) ======
+# ページの内容に関わる tools/ のモジュール。
+# テンプレート・変換処理・設定値のどれを変更してもビルドキーが変わり、次回は全ページが再生成される。
+BUILD_SOURCES = ("publish.py", "md.py", "novel.py", "story.py", "toppage.py")
+
+BuildCache = Dict[str, Tuple[str, str]]  # 出力ファイルパス -> (ビルドキー, 出力内容の sha256)
+
+
+def load_build_cache(path: Path) -> BuildCache:
+    if not path.is_file():
+        return {}
+    cache: BuildCache = {}
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if len(row) != 3:
+                continue
+            filename, build_key, output_hash = row
+            cache[filename] = (build_key, output_hash)
+    return cache
+
+
+def save_build_cache(path: Path, cache: BuildCache) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    items = sorted(cache.items())
+    with path.open("w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(
+            (filename, build_key, output_hash)
+            for filename, (build_key, output_hash) in items
+        )
+
+
+@lru_cache(maxsize=None)
+def markdown_version() -> str:
+    # markdown の版が変わると同じ入力でも生成される HTML が変わりうる
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version("Markdown")
+    except PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def tools_source_digest() -> str:
+    """BUILD_SOURCES のソースの内容から計算したハッシュを返す。"""
+    tools_dir = Path(__file__).resolve().parent
+    h = hashlib.sha256()
+    for name in BUILD_SOURCES:
+        # ファイルごとのダイジェスト（固定長）を連結するので境界が曖昧にならない
+        h.update(hashlib.sha256((tools_dir / name).read_bytes()).digest())
+    return h.hexdigest()
+
+
+def compute_build_key(*parts: str) -> str:
+    """ページ生成に使う入力一式と tools/ のソース, markdown の版からビルドキーを計算する。"""
+    h = hashlib.sha256(tools_source_digest().encode("utf-8"))
+    h.update(b"\n")
+    h.update(markdown_version().encode("utf-8"))
+    for part in parts:
+        h.update(b"\n")
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def is_up_to_date(
+    build_cache: BuildCache,
+    new_build_cache: BuildCache,
+    root: Path,
+    out: Path,
+    build_key: str,
+) -> bool:
+    """
+    out が前回と同じビルドキーで生成され、その後書き換えられていなければ True を返し、
+    前回の記録を new_build_cache に引き継ぐ。
+    False の場合は生成したページを書き出した後に record_build で記録する。
+    """
+    key_str = out.relative_to(root).as_posix()
+    cached = build_cache.get(key_str)
+    if cached is None or cached[0] != build_key:
+        return False
+    # 出力先が削除・変更されていないこと（git checkout などで戻された場合も含む）
+    try:
+        data = out.read_bytes()
+    except OSError:
+        return False
+    if hashlib.sha256(data).hexdigest() != cached[1]:
+        return False
+    new_build_cache[key_str] = cached
+    return True
+
+
+def record_build(
+    new_build_cache: BuildCache,
+    root: Path,
+    out: Path,
+    build_key: str,
+    text: str,
+) -> None:
+    """生成して書き出したページのビルドキーと出力内容のハッシュを new_build_cache に記録する。"""
+    key_str = out.relative_to(root).as_posix()
+    output_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    new_build_cache[key_str] = (build_key, output_hash)
+
+
 def parse_date_from_iso(ts: str) -> str:
     try:
         dt = datetime.fromisoformat(ts)
@@ -87,11 +196,49 @@ def render_site_header(root_prefix: str, last_updated_date: str) -> str:
 </header>"""
 
 
+def md_to_html(text: str) -> str:
+    # markdown パッケージの import は重いので、実際に変換するまで遅らせる
+    from markdown import markdown
+    return markdown(text)
+
+
+# タイトルやあらすじは複数ページで同じ文字列が何度も変換されるのでキャッシュする
+@lru_cache(maxsize=4096)
 def apply_ruby_and_markdown(text: str) -> str:
     return md_to_html(md.to_html_ruby(text))
 
 
-def truncate_outline(outline: str, limit: int = 150) -> str:
+@lru_cache(maxsize=4096)
+def ruby_title_html(title: str) -> str:
+    """小説・章のタイトルのルビを HTML にする。同じタイトルを複数箇所で使うのでキャッシュする。"""
+    return md.to_html_ruby(title)
+
+
+def render_story_body(content: str) -> str:
+    """
+    話の本文を HTML に変換する。
+    本文は話ごとに異なりキャッシュが効かないので、apply_ruby_and_markdown を通さない
+    （長い文字列のハッシュ計算と保持を避ける）。
+    """
+    # 本文に全角スペースを表示する
+    # 置換が一種類だけなら str.translate（非 1:1 の写像は遅い）より str.replace が速い
+    # ルビと一緒に一つの正規表現で置換するとコールバック呼び出しが増えてかえって遅い
+    text = content.replace(IDEOGRAPHIC_SPACE, IDEOGRAPHIC_SPACE_REF)
+    return md_to_html(md.to_html_ruby(text))
+
+
+def truncate_outline_plain(outline: str, limit: int = 150) -> str:
+    """
+    OGP の description 用にあらすじ・本文を切り詰めたプレーンテキストを返す。
+    ルビは親文字だけを残す。HTML エスケープは build_head で行う。
+    """
+    s = md.to_plain_ruby(outline.replace("\n", " ").strip())
+    if len(s) <= limit:
+        return s
+    return s[:limit] + "..."
+
+
+def truncate_outline_html(outline: str, limit: int = 150) -> str:
     s = outline.replace("\n", " ").strip()
     if len(s) <= limit:
         # ルビも含むと厳密には文字数が変わるが、概ね問題ない想定
@@ -101,6 +248,7 @@ def truncate_outline(outline: str, limit: int = 150) -> str:
         truncated = s[:limit] + "..."
         return apply_ruby_and_markdown(truncated)
 
+@lru_cache(maxsize=4096)
 def parse_tags(tags_md: str) -> str:
     tags: List[str] = []
     for line in tags_md.splitlines():
@@ -113,6 +261,7 @@ def parse_tags(tags_md: str) -> str:
 
 
 # ====== ステータス・バッジ（楕円囲みテキスト） ======
+@lru_cache(maxsize=4096)
 def render_status_badge(status: str) -> str:
     status = status.strip()
     cls = "status-other"
@@ -132,28 +281,50 @@ def absolute_url(path_from_root: str) -> Optional[str]:
     return None
 
 
-def choose_og_image(novel_dirname: Optional[str]) -> str:
+def list_public_files(public_dir: Path) -> Set[str]:
+    """
+    OGP 画像の候補になり得る docs/ 直下と docs/ogp/ 直下のファイルを
+    サイトルート相対パス（先頭の「/」無し）の集合で返す。
+    """
+    files: Set[str] = set()
+    for sub in ("", "ogp"):
+        try:
+            with os.scandir(public_dir / sub) as it:
+                for e in it:
+                    if e.is_file():
+                        files.add(f"{sub}/{e.name}" if sub else e.name)
+        except FileNotFoundError:
+            pass
+    return files
+
+
+def choose_og_image(public_files: Set[str], novel_dirname: Optional[str]) -> str:
     """
     /docs をサイトルートとみなし、/ogp/<novel>.png → /ogp/default.png
     → /apple-touch-icon.png → /favicon-32x32.png の順で存在するものを返す。
+    存在確認は list_public_files で取得した public_files に対して行う。
     返り値は「/」から始まるサイトルート相対パス。
     """
-    root = Path(__file__).resolve().parents[1]
-    public = root / "docs"
     candidates = []
     if novel_dirname:
-        candidates.append(public / "ogp" / f"{novel_dirname}.png")
+        candidates.append(f"ogp/{novel_dirname}.png")
     candidates.extend([
-        public / "ogp" / "default.png",
-        public / "apple-touch-icon.png",
-        public / "favicon-32x32.png",
+        "ogp/default.png",
+        "apple-touch-icon.png",
+        "favicon-32x32.png",
     ])
     for c in candidates:
-        if c.is_file():
-            return "/" + c.relative_to(public).as_posix()
+        if c in public_files:
+            return "/" + c
     return "/favicon-32x32.png"
 
 
+# build_head でページ毎に変わらない値は一度だけエスケープしておく
+_TWITTER_HANDLE_HTML = html_escape(TWITTER_HANDLE)
+# エスケープ不要な og:type の値
+_LITERAL_OG_TYPES = frozenset({"website", "article"})
+
+
 def build_head(
     title_text: str,
     root_prefix: str,
@@ -175,6 +346,7 @@ def build_head(
     og_url_abs = absolute_url(og_url_path_from_root) if og_url_path_from_root else None
     og_image_abs = absolute_url(og_image_path_from_root) or og_image_path_from_root
     meta_og_url = f'\n    <meta property="og:url" content="{html_escape(og_url_abs)}">' if og_url_abs else ""
+    og_type_html = og_type if og_type in _LITERAL_OG_TYPES else html_escape(og_type)
 
     return f"""<head>
     <meta charset="UTF-8">
@@ -191,10 +363,10 @@ def build_head(
     <meta property="og:site_name" content="もぐらノベル">
     <meta property="og:title" content="{html_escape(og_title)}">
     <meta property="og:description" content="{html_escape(og_desc)}">
-    <meta property="og:type" content="{html_escape(og_type)}">
+    <meta property="og:type" content="{og_type_html}">
     <meta property="og:image" content="{html_escape(og_image_abs)}">{meta_og_url}
     <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:site" content="{html_escape(TWITTER_HANDLE)}">
+    <meta name="twitter:site" content="{_TWITTER_HANDLE_HTML}">
 
     <link rel="stylesheet" href="{root_prefix}css/style.css">
 </head>"""
@@ -209,6 +381,37 @@ class NovelContext:
     last_updated_iso: str
     story_updated_iso: Dict[int, str]  # story.number -> ts
     index_to_story: Dict[int, Story]   # 1-origin 表示順 -> Story
+    story_to_index: Dict[Story, int]   # Story -> 1-origin 表示順（index_to_story の逆引き）
+    og_image_path: str                 # OGP 画像のサイトルート相対パス
+
+
+# ページ生成に使う入力を全て含めたビルドキー（ヘッダの最終更新日や前後の話へのリンクも含む）
+def novel_top_page_build_key(site_last_date: str, nc: NovelContext) -> str:
+    return compute_build_key(
+        site_last_date,
+        nc.public_dir.name,
+        nc.novel.hash(),
+        nc.last_updated_iso,
+        nc.og_image_path,
+        *(
+            nc.story_updated_iso.get(s.number, nc.last_updated_iso)
+            for s in nc.index_to_story.values()
+        ),
+    )
+
+
+def story_page_build_key(site_last_date: str, nc: NovelContext, story_index: int) -> str:
+    s = nc.index_to_story[story_index]
+    return compute_build_key(
+        site_last_date,
+        nc.public_dir.name,
+        nc.novel.title,
+        str(story_index),
+        str(len(nc.index_to_story)),
+        s.hash(),
+        nc.story_updated_iso.get(s.number, nc.last_updated_iso),
+        nc.og_image_path,
+    )
 
 
 def build_top_page(
@@ -216,6 +419,7 @@ def build_top_page(
     tp: TopPage,
     history: History,
     now_iso: str,
+    public_files: Set[str],
 ) -> Tuple[str, List[NovelContext], str]:
     # TopPage（自己紹介）の更新履歴
     top_rel = tp.path
@@ -230,10 +434,12 @@ def build_top_page(
 
         story_updated_iso: Dict[int, str] = {}
         index_to_story: Dict[int, Story] = {}
+        story_to_index: Dict[Story, int] = {}
         for idx, s in enumerate(novel.stories, start=1):
             s_ts_iso = update_history_entry(history, s.path, s.hash(), now_iso)
             story_updated_iso[s.number] = s_ts_iso
             index_to_story[idx] = s
+            story_to_index[s] = idx
 
         all_ts = [n_ts_iso] + list(story_updated_iso.values())
         n_last_iso = max(all_ts) if all_ts else n_ts_iso
@@ -245,6 +451,8 @@ def build_top_page(
             last_updated_iso=n_last_iso,
             story_updated_iso=story_updated_iso,
             index_to_story=index_to_story,
+            story_to_index=story_to_index,
+            og_image_path=choose_og_image(public_files, ndir.name),
         )
         novel_contexts.append(nc)
 
@@ -254,7 +462,7 @@ def build_top_page(
 
     # ---- head（favicon / OGP / X）----
     og_desc = "『もぐらノベル』は吾輩はもぐらであるが趣味で書いた小説を公開する個人サイトです。"
-    og_img = choose_og_image(None)
+    og_img = choose_og_image(public_files, None)
     head_html = build_head(
         title_text="もぐらノベル",
         root_prefix="",
@@ -273,9 +481,9 @@ def build_top_page(
     for nc in novel_contexts:
         n = nc.novel
         n_pub_dir_name = nc.public_dir.name
-        title_html = md.to_html_ruby(n.title)
+        title_html = ruby_title_html(n.title)
         tags_str = parse_tags(n.tags)
-        outline_summary = truncate_outline(n.outline)
+        outline_summary = truncate_outline_html(n.outline)
         last_date = parse_date_from_iso(nc.last_updated_iso) or site_last_date
         status_html = render_status_badge(n.status)
         # warning: `outline_summary` はエスケープ無しで埋め込まれる
@@ -320,11 +528,22 @@ def build_top_page(
     return index_html, novel_contexts, site_last_date
 
 
+def render_toc_item(nc: NovelContext, disp_index: int, s: Story, last_date: str) -> str:
+    """目次の一話分の <li> を生成する。"""
+    s_title_html = md.to_html_ruby(s.title)
+    s_ts_iso = nc.story_updated_iso.get(s.number, nc.last_updated_iso)
+    s_date = parse_date_from_iso(s_ts_iso) or last_date
+    return (
+        f'<li><a href="{disp_index}.html" class="chapter-link">{disp_index}話 {s_title_html}</a>'
+        f'<span class="metadata">{s_date} 更新 | {s.length}文字</span></li>'
+    )
+
+
 def build_novel_top_page(site_last_date: str, nc: NovelContext) -> str:
     n = nc.novel
     header_html = render_site_header("../", site_last_date)
 
-    title_html = md.to_html_ruby(n.title)
+    title_html = ruby_title_html(n.title)
     tags_str = parse_tags(n.tags)
     last_date = parse_date_from_iso(nc.last_updated_iso) or site_last_date
     outline_html = apply_ruby_and_markdown(n.outline)
@@ -350,40 +569,27 @@ def build_novel_top_page(site_last_date: str, nc: NovelContext) -> str:
     toc_body = []
     ordered = n.get_stories_ordered()
     if n.has_chapters and isinstance(ordered, dict):
-        rev_index = {v: k for k, v in nc.index_to_story.items()}
         for idx_ch, (chap_title, stories) in enumerate(ordered.items(), start=1):
-            chap_title_html = md.to_html_ruby(chap_title)
+            chap_title_html = ruby_title_html(chap_title)
             toc_body.append(f'<h3 class="chapter-title">{idx_ch}章: {chap_title_html}</h3>')
             toc_body.append("<ul>")
-            for s in stories:
-                disp_index = rev_index[s]
-                file_name = f"{disp_index}.html"
-                s_title_html = md.to_html_ruby(s.title)
-                s_ts_iso = nc.story_updated_iso.get(s.number, nc.last_updated_iso)
-                s_date = parse_date_from_iso(s_ts_iso) or last_date
-                toc_body.append(
-                    f'<li><a href="{file_name}" class="chapter-link">{disp_index}話 {s_title_html}</a>'
-                    f'<span class="metadata">{s_date} 更新 | {s.length}文字</span></li>'
-                )
+            toc_body.extend([
+                render_toc_item(nc, nc.story_to_index[s], s, last_date) for s in stories
+            ])
             toc_body.append("</ul>")
     else:
         toc_body.append("<ul>")
-        for idx, s in nc.index_to_story.items():
-            file_name = f"{idx}.html"
-            s_title_html = md.to_html_ruby(s.title)
-            s_ts_iso = nc.story_updated_iso.get(s.number, nc.last_updated_iso)
-            s_date = parse_date_from_iso(s_ts_iso) or last_date
-            toc_body.append(
-                f'<li><a href="{file_name}" class="chapter-link">{idx}話 {s_title_html}</a>'
-                f'<span class="metadata">{s_date} 更新 | {s.length}文字</span></li>'
-            )
+        toc_body.extend([
+            render_toc_item(nc, idx, s, last_date)
+            for idx, s in nc.index_to_story.items()
+        ])
         toc_body.append("</ul>")
 
     toc_html = "\n".join(toc_body)
 
     # ---- head（favicon / OGP / X）----
-    og_desc = truncate_outline(n.outline, 120)
-    og_img = choose_og_image(nc.public_dir.name)
+    og_desc = truncate_outline_plain(n.outline, 120)
+    og_img = nc.og_image_path
     head_html = build_head(
         title_text=f"{n.title} - もぐらノベル",
         root_prefix="../",
@@ -441,8 +647,7 @@ def build_story_page(site_last_date: str, nc: NovelContext, story_index: int) ->
 
     s_ts_iso = nc.story_updated_iso.get(s.number, nc.last_updated_iso)
     s_date = parse_date_from_iso(s_ts_iso) or site_last_date
-    # 本文に全角スペースを表示する
-    body_html = apply_ruby_and_markdown(s.content.replace("　", "&#x3000;"))
+    body_html = render_story_body(s.content)
 
     prev_html = ""
     next_html = ""
@@ -461,8 +666,8 @@ def build_story_page(site_last_date: str, nc: NovelContext, story_index: int) ->
 
     # ---- head（favicon / OGP / X）----
     og_title = f"{title_text} - {n.title}"
-    og_desc = truncate_outline(s.content, 110)
-    og_img = choose_og_image(nc.public_dir.name)
+    og_desc = truncate_outline_plain(s.content, 110)
+    og_img = nc.og_image_path
     head_html = build_head(
         title_text=f"{title_text} - {n.title}",
         root_prefix="../",
@@ -496,14 +701,62 @@ def build_story_page(site_last_date: str, nc: NovelContext, story_index: int) ->
     return page_html
 
 
+# ====== 各話ページの並列生成 ======
+# 再生成する話がこれ未満ならプロセスを起動せずに生成する
+STORY_PROCESS_THRESHOLD = 8
+
+# ワーカープロセスごとに一度だけ受け取る共有データ
+_worker_site_last_date: str = ""
+_worker_novel_contexts: List[NovelContext] = []
+
+
+def _init_story_worker(site_last_date: str, novel_contexts: List[NovelContext]) -> None:
+    # 各タスクで NovelContext（全話の本文を含む）を毎回 pickle しないよう、
+    # ワーカー起動時に一度だけ受け取っておく
+    global _worker_site_last_date, _worker_novel_contexts
+    _worker_site_last_date = site_last_date
+    _worker_novel_contexts = novel_contexts
+
+
+def _render_story_page(novel_index: int, story_index: int) -> str:
+    nc = _worker_novel_contexts[novel_index]
+    return build_story_page(_worker_site_last_date, nc, story_index)
+
+
+# ====== 出力 ======
+def write_outputs(outputs: Dict[Path, str]) -> None:
+    """生成済みの HTML をまとめて書き出す。書き込みは I/O 待ちが主なのでスレッドで並行させる。"""
+    def write(item: Tuple[Path, str]) -> None:
+        out, text = item
+        out.write_bytes(text.encode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        # 例外を呼び出し元に伝えるため結果を消費する
+        list(ex.map(write, outputs.items()))
+
+
+def copy_if_changed(src: Path, dst: Path) -> None:
+    """
+    src を dst にコピーする。
+    dst が src と同じ内容で存在する場合はコピーしない。
+    （git checkout などで dst だけ戻された場合は更新日時・サイズでは判別できないので内容で比べる）
+    """
+    data = src.read_bytes()
+    try:
+        if dst.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 def copy_style(root: Path):
     src = root / "private" / "css"/ "style.css"
     if not src.is_file():
         raise FileNotFoundError(f"Style file not found: {src}")
-    dst_dir = root / "docs" / "css"
-    dst_dir.mkdir(parents=True, exist_ok=True)
-    dst = dst_dir / "style.css"
-    dst.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+    copy_if_changed(src, root / "docs" / "css" / "style.css")
 
 
 def main():
@@ -512,6 +765,7 @@ def main():
     self_intro = private_dir / "self_intro.md"
     public_dir = root / "docs"
     history_path = root / "data" / "update_history.csv"
+    build_cache_path = root / "data" / "build_cache.csv"
 
     # TopPage 検証
     tp_result = TopPage.load_if_valid(self_intro.relative_to(root))
@@ -523,27 +777,72 @@ def main():
 
     # 履歴
     history = load_history(history_path)
+    build_cache = load_build_cache(build_cache_path)
+    new_build_cache: BuildCache = {}
     now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
+    # 生成したページはここに集めて最後にまとめて書き出す
+    outputs: Dict[Path, str] = {}
+
     # トップページ
-    index_html, novel_contexts, site_last_date = build_top_page(root, tp, history, now_iso)
+    # OGP 画像の存在確認用に docs/ のファイル一覧を一度だけ取得する
+    public_files = list_public_files(public_dir)
+    index_html, novel_contexts, site_last_date = build_top_page(
+        root, tp, history, now_iso, public_files
+    )
     public_dir.mkdir(parents=True, exist_ok=True)
-    (public_dir / "index.html").write_text(index_html, encoding="utf-8")
+    outputs[public_dir / "index.html"] = index_html
 
     # CSS
     copy_style(root)
 
     # 各小説トップ & 各話
-    for nc in novel_contexts:
+    # 入力が前回の生成時から変わっていないページは生成をスキップする
+    pending_stories: List[Tuple[int, int]] = []  # (novel_contexts の添字, 話の表示順)
+    build_keys: Dict[Path, str] = {}  # 再生成するページ -> ビルドキー
+    for ni, nc in enumerate(novel_contexts):
         nc.public_dir.mkdir(parents=True, exist_ok=True)
-        novel_top_html = build_novel_top_page(site_last_date, nc)
-        (nc.public_dir / "index.html").write_text(novel_top_html, encoding="utf-8")
+        out = nc.public_dir / "index.html"
+        build_key = novel_top_page_build_key(site_last_date, nc)
+        if not is_up_to_date(build_cache, new_build_cache, root, out, build_key):
+            outputs[out] = build_novel_top_page(site_last_date, nc)
+            build_keys[out] = build_key
 
         total = len(nc.index_to_story)
         for idx in range(1, total + 1):
-            story_html = build_story_page(site_last_date, nc, idx)
             out = nc.public_dir / f"{idx}.html"
-            out.write_text(story_html, encoding="utf-8")
+            build_key = story_page_build_key(site_last_date, nc, idx)
+            if is_up_to_date(build_cache, new_build_cache, root, out, build_key):
+                continue
+            pending_stories.append((ni, idx))
+            build_keys[out] = build_key
+
+    # 各話の生成（Markdown 変換）は CPU 処理で互いに独立なのでプロセス並列で行う
+    # ただし数ページ程度ならワーカー起動と NovelContext の受け渡しの方が高くつくので、
+    # このプロセス内で生成する
+    if len(pending_stories) < STORY_PROCESS_THRESHOLD:
+        for ni, idx in pending_stories:
+            nc = novel_contexts[ni]
+            outputs[nc.public_dir / f"{idx}.html"] = build_story_page(
+                site_last_date, nc, idx
+            )
+    else:
+        max_workers = min(len(pending_stories), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_story_worker,
+            initargs=(site_last_date, novel_contexts),
+        ) as ex:
+            futs = [
+                ex.submit(_render_story_page, ni, idx)
+                for ni, idx in pending_stories
+            ]
+            for (ni, idx), f in zip(pending_stories, futs):
+                outputs[novel_contexts[ni].public_dir / f"{idx}.html"] = f.result()
+
+    write_outputs(outputs)
+    for out, build_key in build_keys.items():
+        record_build(new_build_cache, root, out, build_key, outputs[out])
 
     # Favicon コピー
     fnames = [
@@ -555,11 +854,17 @@ def main():
     for fname in fnames:
         src = root / "private" / fname
         if src.is_file():
-            dst = public_dir / fname
-            dst.write_bytes(src.read_bytes())
+            copy_if_changed(src, public_dir / fname)
 
-    # 履歴保存
+    # 履歴・ビルドキャッシュ保存
     save_history(history_path, history)
+    save_build_cache(build_cache_path, new_build_cache)
+
+    # 変換結果のキャッシュを解放する
+    apply_ruby_and_markdown.cache_clear()
+    parse_tags.cache_clear()
+    render_status_badge.cache_clear()
+    ruby_title_html.cache_clear()
 
 
 if __name__ == "__main__":
@@ -6,9 +6,14 @@ from pathlib import Path
 from typing import Union, List
 
 import hashlib
+import re
 
 import md
 
+# number の値（strip 済み）: 符号付きの十進整数。int() が受け付ける "1_0" などは許さない
+# （novel.py の chapters の章区切り番号と同じ規則）
+_NUMBER_RE = re.compile(r"[+-]?\d+")
+
 
 @dataclass(frozen=True)
 class Story:
@@ -74,9 +79,9 @@ class Story:
 
         # number: 整数必須
         number_val = None
-        if "number" in data and number_raw.strip():
-            number_str = number_raw.strip()
-            if _is_int_string(number_str):
+        number_str = number_raw.strip()
+        if "number" in data and number_str:
+            if _NUMBER_RE.fullmatch(number_str):
                 number_val = int(number_str)
             else:
                 errors.append("`number` must be an integer")
@@ -95,19 +100,27 @@ class Story:
         )
 
     def hash(self) -> str:
-        """title, number, content から SHA256 ハッシュ値を計算して返す。"""
-        base = f"{self.title}\n{self.number}\n{self.content}"
-        return hashlib.sha256(base.encode("utf-8")).hexdigest()
-
-
-def _is_int_string(s: str) -> bool:
-    if not s:
-        return False
-    if s[0] in "+-":
-        return s[1:].isdigit()
-    return s.isdigit()
+        """
+        title, number, content から SHA256 ハッシュ値を計算して返す。
+        インスタンスは不変なので、一度計算した値をインスタンスに保持して再利用する。
+        """
+        cached = self.__dict__.get("_hash")
+        if cached is not None:
+            return cached
+
+        # 本文を連結した文字列を作らず、改行区切りで逐次投入する
+        h = hashlib.sha256(self.title.encode("utf-8"))
+        h.update(b"\n")
+        h.update(str(self.number).encode("utf-8"))
+        h.update(b"\n")
+        h.update(self.content.encode("utf-8"))
+        digest = h.hexdigest()
+
+        # frozen dataclass なので object.__setattr__ で保持する
+        object.__setattr__(self, "_hash", digest)
+        return digest
 
 
 def _count_text_length(text: str) -> int:
     # 「本文の文字数」は改行を含めないカウントとする
-    return sum(1 for c in text if c not in ("\n", "\r"))
+    return len(text) - text.count("\n") - text.count("\r")
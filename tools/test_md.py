@@ -37,6 +37,20 @@ And one more <ruby>例<rt>れい</rt></ruby> here.
 Finally, no ruby here."""
         self.assertEqual(md.to_html_ruby(content), expected)
 
+class TestToPlainRuby(unittest.TestCase):
+    def test_to_plain_ruby(self):
+        # Test case with ruby annotation
+        content = "|漢字<かんじ> is a Japanese word."
+        self.assertEqual(md.to_plain_ruby(content), "漢字 is a Japanese word.")
+
+        # Test case without ruby annotation
+        content = "This is a test without ruby."
+        self.assertEqual(md.to_plain_ruby(content), content)
+
+        # Test case with multiple ruby annotations
+        content = "|複雑<ふくざつ>な|例<れい>です。"
+        self.assertEqual(md.to_plain_ruby(content), "複雑な例です。")
+
 def _write_file(dirpath: str, content: str, filename: str = "tmp.md") -> str:
     path = os.path.join(dirpath, filename)
     with open(path, "w", encoding="utf-8") as f:
@@ -131,5 +145,6 @@ value1
             output = md.md_to_json(path)
             self.assertEqual(output, expected_output)
 
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,8 +7,14 @@ from novel import Novel
 
 
 def _write(path: Path, content: str) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    # 改行コードを OS に合わせて変換せず、どの環境でも同じバイト列を書く
+    data = content.encode("utf-8")
+    # 親ディレクトリは書き込みに失敗したときだけ作る
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
     return path
 
 
@@ -275,6 +281,29 @@ invalid line
                 any("`chapters` must be in" in m for m in result)
             )
 
+    def test_chapters_empty_title(self):
+        # 先頭が ":" の行はタイトルが空とみなす（":第一章" というタイトルにはしない）
+        with TemporaryDirectory() as d:
+            novel_dir = Path(d) / "n"
+            index = novel_dir / "index.md"
+            content = """# title
+t
+# tags
+- t
+# status
+連載中
+# outline
+o
+# chapters
+:第一章: 3
+"""
+            _write(index, content)
+            result = Novel.load_if_valid(index)
+            self.assertIsInstance(result, list)
+            self.assertTrue(
+                any("`chapters` must be valid key: value pairs" in m for m in result)
+            )
+
     def test_chapters_duplicate_title_or_number(self):
         # duplicate title
         with TemporaryDirectory() as d:
@@ -473,6 +502,108 @@ c
             self.assertIsInstance(n2, Novel)
             self.assertEqual(n1.hash(), n2.hash())
 
+    def test_hash_distinguishes_chapter_titles_with_separators(self):
+        with TemporaryDirectory() as d:
+            idx = """# title
+t
+# tags
+- t
+# status
+連載中
+# outline
+o
+# chapters
+"""
+            index1 = Path(d) / "n1" / "index.md"
+            index2 = Path(d) / "n2" / "index.md"
+            # 章タイトルに区切り文字風の文字列を含む
+            _write(index1, idx + "a=1;b: 2\n")
+            _write(index2, idx + "a: 1\nb: 2\n")
+
+            n1 = Novel.load_if_valid(index1)
+            n2 = Novel.load_if_valid(index2)
+            self.assertIsInstance(n1, Novel)
+            self.assertIsInstance(n2, Novel)
+            self.assertNotEqual(n1.hash(), n2.hash())
+
+
+class TestNovelLoadMany(unittest.TestCase):
+    def test_results_follow_input_order(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            good_index = root / "good" / "index.md"
+            _write(good_index, """# title
+t
+# tags
+- t
+# status
+連載中
+# outline
+o
+""")
+            bad_index = root / "bad" / "index.md"
+            _write(bad_index, """# title
+タイトルだけ
+""")
+
+            results = Novel.load_many([bad_index, good_index, bad_index])
+            self.assertEqual(len(results), 3)
+            self.assertIsInstance(results[0], list)
+            self.assertIsInstance(results[1], Novel)
+            self.assertIsInstance(results[2], list)
+            self.assertEqual(results[1].title, "t")
+
+            self.assertEqual(Novel.load_many([]), [])
+
+    def test_stories_of_each_novel_are_loaded(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            idx = """# title
+t
+# tags
+- t
+# status
+連載中
+# outline
+o
+"""
+            indexes = []
+            for name, count in (("a", 3), ("b", 1), ("c", 0)):
+                index = root / name / "index.md"
+                _write(index, idx)
+                for i in range(1, count + 1):
+                    _write(root / name / f"{i:03}.md", f"""# title
+{name}-{i}
+# number
+{i}
+# content
+c
+""")
+                indexes.append(index)
+            # 不正な話ファイルを持つ小説のエラーも小説ごとに返る
+            bad_index = root / "bad" / "index.md"
+            _write(bad_index, idx)
+            _write(root / "bad" / "001.md", """# title
+x
+# number
+not-int
+# content
+c
+""")
+            indexes.append(bad_index)
+
+            results = Novel.load_many(indexes)
+            self.assertEqual(
+                [r.num_stories for r in results[:3]], [3, 1, 0]
+            )
+            self.assertEqual(
+                [s.title for s in results[0].stories], ["a-1", "a-2", "a-3"]
+            )
+            self.assertIsInstance(results[3], list)
+            self.assertTrue(
+                any("`number` must be an integer" in m for m in results[3])
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
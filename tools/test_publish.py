@@ -0,0 +1,166 @@
+import os
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import publish
+
+
+def _build(root: Path, cache: publish.BuildCache, out: Path, build_key: str, text: str) -> None:
+    """main と同じ手順でページを書き出してビルドキャッシュに記録する。"""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(text.encode("utf-8"))
+    publish.record_build(cache, root, out, build_key, text)
+
+
+class TestBuildCache(unittest.TestCase):
+    def test_unchanged_page_is_skipped(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            out = root / "docs" / "n" / "1.html"
+            key = publish.compute_build_key("a", "b")
+            cache: publish.BuildCache = {}
+            _build(root, cache, out, key, "<p>本文</p>")
+
+            new_cache: publish.BuildCache = {}
+            self.assertTrue(publish.is_up_to_date(cache, new_cache, root, out, key))
+            # スキップしたページの記録は次回に引き継がれる
+            self.assertEqual(new_cache, cache)
+
+    def test_input_change_regenerates(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            out = root / "docs" / "n" / "1.html"
+            cache: publish.BuildCache = {}
+            _build(root, cache, out, publish.compute_build_key("a"), "<p>本文</p>")
+
+            new_cache: publish.BuildCache = {}
+            new_key = publish.compute_build_key("a2")
+            self.assertFalse(
+                publish.is_up_to_date(cache, new_cache, root, out, new_key)
+            )
+            self.assertEqual(new_cache, {})
+
+    def test_modified_output_regenerates(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            out = root / "docs" / "n" / "1.html"
+            key = publish.compute_build_key("a")
+            cache: publish.BuildCache = {}
+            _build(root, cache, out, key, "<p>新しい本文</p>")
+
+            # git checkout docs/ などで古い内容に戻された
+            out.write_bytes("<p>古い本文</p>".encode("utf-8"))
+            self.assertFalse(publish.is_up_to_date(cache, {}, root, out, key))
+
+    def test_deleted_output_regenerates(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            out = root / "docs" / "n" / "1.html"
+            key = publish.compute_build_key("a")
+            cache: publish.BuildCache = {}
+            _build(root, cache, out, key, "<p>本文</p>")
+
+            out.unlink()
+            self.assertFalse(publish.is_up_to_date(cache, {}, root, out, key))
+
+    def test_tools_source_change_regenerates(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            out = root / "docs" / "n" / "1.html"
+            key = publish.compute_build_key("a")
+            cache: publish.BuildCache = {}
+            _build(root, cache, out, key, "<p>本文</p>")
+
+            # テンプレートや変換処理のソースが変わった
+            with mock.patch.object(publish, "tools_source_digest", return_value="changed"):
+                new_key = publish.compute_build_key("a")
+            self.assertNotEqual(key, new_key)
+            self.assertFalse(publish.is_up_to_date(cache, {}, root, out, new_key))
+
+    def test_tools_source_digest_covers_build_sources(self):
+        with TemporaryDirectory() as d:
+            tools_dir = Path(d)
+            for name in publish.BUILD_SOURCES:
+                (tools_dir / name).write_bytes(b"# " + name.encode("ascii"))
+            fake_file = str(tools_dir / "publish.py")
+
+            publish.tools_source_digest.cache_clear()
+            try:
+                with mock.patch.object(publish, "__file__", fake_file):
+                    before = publish.tools_source_digest()
+                    publish.tools_source_digest.cache_clear()
+                    (tools_dir / "md.py").write_bytes(b"# md.py changed")
+                    after = publish.tools_source_digest()
+            finally:
+                publish.tools_source_digest.cache_clear()
+            self.assertNotEqual(before, after)
+
+    def test_markdown_version_is_part_of_key(self):
+        key = publish.compute_build_key("a")
+        publish.markdown_version.cache_clear()
+        try:
+            with mock.patch("importlib.metadata.version", return_value="0.0.0"):
+                other = publish.compute_build_key("a")
+        finally:
+            publish.markdown_version.cache_clear()
+        self.assertNotEqual(key, other)
+
+    def test_save_and_load_round_trip(self):
+        with TemporaryDirectory() as d:
+            path = Path(d) / "data" / "build_cache.csv"
+            cache: publish.BuildCache = {
+                "docs/n/1.html": ("k1", "h1"),
+                "docs/n/index.html": ("k2", "h2"),
+            }
+            publish.save_build_cache(path, cache)
+            self.assertEqual(publish.load_build_cache(path), cache)
+
+    def test_old_two_column_cache_is_ignored(self):
+        with TemporaryDirectory() as d:
+            path = Path(d) / "build_cache.csv"
+            path.write_bytes(b"docs/n/1.html,k1\n")
+            # 出力ハッシュの無い古い形式は全ページ再生成させる
+            self.assertEqual(publish.load_build_cache(path), {})
+
+
+class TestCopyIfChanged(unittest.TestCase):
+    def test_restored_older_copy_is_overwritten(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            src = root / "private" / "css" / "style.css"
+            dst = root / "docs" / "css" / "style.css"
+            src.parent.mkdir(parents=True)
+            src.write_bytes(b"a { color: #111; }\n")
+            publish.copy_if_changed(src, dst)
+
+            # src の色だけ変えて（同じバイト数）公開した後、
+            # git checkout で dst だけ古い内容に戻された（更新日時は dst の方が新しい）
+            src.write_bytes(b"a { color: #222; }\n")
+            publish.copy_if_changed(src, dst)
+            dst.write_bytes(b"a { color: #111; }\n")
+            later = time.time() + 100
+            os.utime(dst, (later, later))
+
+            publish.copy_if_changed(src, dst)
+            self.assertEqual(dst.read_bytes(), src.read_bytes())
+
+    def test_same_contents_are_not_copied(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            src = root / "style.css"
+            dst = root / "docs" / "style.css"
+            src.write_bytes(b"a { color: #111; }\n")
+            publish.copy_if_changed(src, dst)
+
+            old_time = time.time() - 1000
+            os.utime(dst, (old_time, old_time))
+            publish.copy_if_changed(src, dst)
+            # 内容が同じなので書き直されていない
+            self.assertEqual(dst.stat().st_mtime, old_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,8 +7,14 @@ from story import Story
 
 
 def _write(path: Path, content: str) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    # 改行コードを OS に合わせて変換せず、どの環境でも同じバイト列を書く
+    data = content.encode("utf-8")
+    # 親ディレクトリは書き込みに失敗したときだけ作る
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
     return path
 
 
@@ -117,6 +123,23 @@ not-int
             self.assertIsInstance(result, list)
             self.assertTrue(any("`number` must be an integer" in msg for msg in result))
 
+    def test_number_rejects_underscore(self):
+        # int() は "1_0" を 10 と解釈するが、整数表記としては認めない
+        with TemporaryDirectory() as d:
+            p = Path(d) / "1.md"
+            content = """# title
+タイトル
+# number
+1_0
+# content
+本文
+"""
+            _write(p, content)
+            result = Story.load_if_valid(p)
+
+            self.assertIsInstance(result, list)
+            self.assertTrue(any("`number` must be an integer" in msg for msg in result))
+
     def test_duplicate_headers(self):
         with TemporaryDirectory() as d:
             p = Path(d) / "1.md"
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import time
 import unittest
@@ -6,10 +7,27 @@ from tempfile import TemporaryDirectory
 
 from toppage import TopPage
 
+# 複数のテストで使う最小限の妥当な index.md
+_BASIC_INDEX = """# title
+t
+# tags
+- t
+# status
+連載中
+# outline
+o
+"""
+
 
 def _write(path: Path, content: str) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    # 改行コードを OS に合わせて変換せず、どの環境でも同じバイト列を書く
+    data = content.encode("utf-8")
+    # 親ディレクトリは書き込みに失敗したときだけ作る
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
     return path
 
 
@@ -217,16 +235,7 @@ same
             _write(self_intro, "自己紹介テキスト")
 
             n = private_dir / "novel"
-            idx = """# title
-t
-# tags
-- t
-# status
-連載中
-# outline
-o
-"""
-            _write(n / "index.md", idx)
+            _write(n / "index.md", _BASIC_INDEX)
 
             body = """# title
 A
@@ -242,6 +251,11 @@ c
             self.assertIsInstance(tp1, TopPage)
             h1 = tp1.hash()
 
+            # 何も変わっていなければ読み直しても同じハッシュになる
+            tp_same = TopPage.load_if_valid(self_intro)
+            self.assertIsInstance(tp_same, TopPage)
+            self.assertEqual(h1, tp_same.hash())
+
             # 本文だけ変更して Novel.hash が変わる → TopPage.hash も変わるはず
             body2 = """# title
 A
@@ -258,5 +272,45 @@ cc
 
             self.assertNotEqual(h1, h2)
 
+            # 話を追加しても変わる
+            _write(n / "002.md", """# title
+B
+# number
+2
+# content
+d
+""")
+            tp3 = TopPage.load_if_valid(self_intro)
+            self.assertIsInstance(tp3, TopPage)
+            self.assertEqual(len(tp3.novels[0].stories), 2)
+            self.assertNotEqual(h2, tp3.hash())
+
+    def test_hash_matches_joined_parts(self):
+        with TemporaryDirectory() as d:
+            root = Path(d)
+            private_dir = root / "private"
+            self_intro = private_dir / "self_intro.md"
+            _write(self_intro, "自己紹介テキスト")
+
+            n = private_dir / "novel"
+            _write(n / "index.md", _BASIC_INDEX)
+            _write(n / "001.md", """# title
+A
+# number
+1
+# content
+c
+""")
+
+            tp = TopPage.load_if_valid(self_intro)
+            self.assertIsInstance(tp, TopPage)
+
+            # 逐次投入しても、公開済みの更新履歴と同じ
+            # 「改行区切りで連結した文字列の sha256」になっている
+            parts = [tp.title, tp.self_intro] + [nv.hash() for nv in tp.novels]
+            expected = hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+            self.assertEqual(tp.hash(), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
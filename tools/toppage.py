@@ -6,6 +6,7 @@ from typing import Tuple, List, Union
 
 import hashlib
 import os
+from operator import attrgetter
 
 from novel import Novel
 
@@ -37,15 +38,17 @@ class TopPage:
         p = Path(path)
         errors: List[str] = []
 
-        # self_intro.md 存在確認
-        if not p.is_file():
-            return [f"Self intro file not found: {p}"]
-
         # 自己紹介本文読み込み
+        # 事前に is_file で確かめず、読めなかったときだけ存在を確認する
         try:
             raw = p.read_text(encoding="utf-8")
         except UnicodeDecodeError:
             return [f"Self intro file is not valid UTF-8: {p}"]
+        except OSError:
+            # 存在しない・ディレクトリである（Windows では PermissionError になる）
+            if not p.is_file():
+                return [f"Self intro file not found: {p}"]
+            raise
 
         # ブランクチェック（README に明記されている）
         if not raw.strip():
@@ -60,20 +63,28 @@ class TopPage:
         novel_dirs: List[Path] = []
         novels: List[Novel] = []
 
-        for child in sorted(private_dir.iterdir()):
-            if not child.is_dir():
-                continue
-            index_md = child / "index.md"
-            if not index_md.is_file():
+        # is_dir は os.scandir のエントリが持つ情報で判定できるので stat は index.md の分だけで済む
+        with os.scandir(private_dir) as it:
+            entries = [e for e in it if e.is_dir()]
+        entries.sort(key=attrgetter("name"))
+        # 判定は文字列パスのまま行い、Path は小説ディレクトリと分かったものだけ作る
+        index_paths: List[Path] = []
+        for e in entries:
+            index_str = os.path.join(e.path, "index.md")
+            if not os.path.isfile(index_str):
                 continue
+            index_paths.append(Path(index_str))
+
+        # 結果は入力順に並ぶので、エラーの順序も従来通り
+        results = Novel.load_many(index_paths)
 
-            novel_result = Novel.load_if_valid(index_md)
+        for index_md, novel_result in zip(index_paths, results):
             if isinstance(novel_result, list):
                 # Novel 側のエラーを TopPage のエラーとして連結
                 for msg in novel_result:
                     errors.append(f"{index_md}: {msg}")
             else:
-                novel_dirs.append(child)
+                novel_dirs.append(index_md.parent)
                 novels.append(novel_result)
 
         if errors:
@@ -86,33 +97,19 @@ class TopPage:
         #   3. Novel.title (昇順)
         #
         # 更新日時は index.md および配下話ファイルの mtime の最大値を使う。
-        def novel_last_updated(n: Novel) -> float:
-            times: List[float] = []
-            # index.md
-            try:
-                times.append(os.path.getmtime(n.path))
-            except OSError:
-                pass
-            # story ファイル
-            for s in n.stories:
-                try:
-                    times.append(os.path.getmtime(s.path))
-                except OSError:
-                    pass
-            return max(times) if times else 0.0
+        # ソート中に何度も stat しないよう、Novel ごとに一度だけ求めておく。
+        last_updated = {n.path: _novel_last_updated(n) for n in novels}
+        status_order_of = _STATUS_ORDER.get
 
         def sort_key(n: Novel):
-            updated = novel_last_updated(n)
-            status_order = _STATUS_ORDER.get(n.status, 999)
+            updated = last_updated[n.path]
+            status_order = status_order_of(n.status, 999)
             return (-updated, status_order, n.title)
 
-        novels_sorted = tuple(sorted(novels, key=sort_key))
-        novel_dirs_sorted = tuple(
-            d for _, d in sorted(
-                zip(novels, novel_dirs),
-                key=lambda pair: sort_key(pair[0])
-            )
-        )
+        # Novel とディレクトリを組にして一度だけ並べ替え、同じ順序を両方に使う
+        pairs = sorted(zip(novels, novel_dirs), key=lambda pair: sort_key(pair[0]))
+        novels_sorted = tuple(n for n, _ in pairs)
+        novel_dirs_sorted = tuple(d for _, d in pairs)
 
         # サイトタイトル / URL は仕様に沿って固定値とする
         site_title = "もぐらノベル"
@@ -124,9 +121,7 @@ class TopPage:
             url=site_url,
             self_intro=raw.strip(),
             novels=novels_sorted,
-            novel_directories=tuple(
-                nd for nd in novel_dirs_sorted
-            ),
+            novel_directories=novel_dirs_sorted,
         )
 
     def hash(self) -> str:
@@ -134,9 +129,46 @@ class TopPage:
         コンテンツのハッシュを
         title, self_intro, novels の全 Novel.hash()
         から計算する。
+        インスタンスは不変なので、一度計算した値をインスタンスに保持して再利用する。
         """
-        parts: List[str] = [self.title, self.self_intro]
+        cached = self.__dict__.get("_hash")
+        if cached is not None:
+            return cached
+
+        # 各要素を改行区切りで逐次投入する（"\n".join したものと同じ値になる）
+        h = hashlib.sha256(self.title.encode("utf-8"))
+        h.update(b"\n")
+        h.update(self.self_intro.encode("utf-8"))
         for n in self.novels:
-            parts.append(n.hash())
-        base = "\n".join(parts)
-        return hashlib.sha256(base.encode("utf-8")).hexdigest()
+            h.update(b"\n")
+            h.update(n.hash().encode("ascii"))
+        digest = h.hexdigest()
+
+        # frozen dataclass なので object.__setattr__ で保持する
+        object.__setattr__(self, "_hash", digest)
+        return digest
+
+
+def _novel_last_updated(n: Novel) -> float:
+    """
+    index.md と話ファイルの mtime の最大値を返す。
+    ファイルごとに os.path.getmtime を呼ぶ代わりに、小説ディレクトリを一度だけ走査する。
+    """
+    names = {n.path.name}
+    names.update(s.path.name for s in n.stories)
+    latest = 0.0
+    try:
+        with os.scandir(n.path.parent) as it:
+            for e in it:
+                if e.name not in names:
+                    continue
+                try:
+                    mtime = e.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > latest:
+                    latest = mtime
+    except OSError:
+        pass
+    return latest
+